@@ -0,0 +1,75 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Single-pass password scanner for wordlist mode.
+
+Fuses the character-class, repeated-character, and sequential-run checks
+from password_analyzer into one walk over the raw password bytes.
+Build in place with:
+
+    cythonize -i scripts/_analyzer.pyx
+
+password_analyzer falls back to its pure-Python checks when this module
+is not compiled. Classification is byte-oriented, so non-ASCII input
+counts as "other" rather than as letters.
+"""
+
+# Byte-class table: 1=uppercase, 2=lowercase, 4=digit, 8=special, 16=other
+cdef unsigned char _CLASS[256]
+
+cdef void _build_table():
+    cdef bytes special = b'!@#$%^&*(),.?":{}|<>'
+    cdef int b
+    for b in range(256):
+        if 0x41 <= b <= 0x5A:
+            _CLASS[b] = 1
+        elif 0x61 <= b <= 0x7A:
+            _CLASS[b] = 2
+        elif 0x30 <= b <= 0x39:
+            _CLASS[b] = 4
+        elif b in special:
+            _CLASS[b] = 8
+        else:
+            _CLASS[b] = 16
+
+_build_table()
+
+def scan_bytes(bytes data):
+    """
+    Scan password bytes in a single pass.
+
+    Returns (class_mask, has_repeat, has_seq_num, has_seq_alpha), where
+    class_mask uses the _CLASS bit layout above.
+    """
+    cdef const unsigned char* p = data
+    cdef Py_ssize_t n = len(data)
+    cdef Py_ssize_t i
+    cdef unsigned int mask = 0
+    cdef unsigned char c, lc
+    cdef unsigned char prev = 0, prev2 = 0   # raw previous bytes
+    cdef unsigned char lc1 = 0, lc2 = 0      # case-folded previous bytes
+    cdef bint repeat = False, seq_num = False, seq_alpha = False
+
+    for i in range(n):
+        c = p[i]
+        mask |= _CLASS[c]
+
+        # Three identical bytes in a row
+        if c == prev and prev == prev2:
+            repeat = True
+        # Three ascending digits (012 ... 789)
+        if 0x32 <= c <= 0x39 and prev == c - 1 and prev2 == c - 2:
+            seq_num = True
+        # Three ascending letters within a-g, case-insensitive (abc ... efg)
+        if 0x41 <= c <= 0x5A:
+            lc = c + 32
+        else:
+            lc = c
+        if 0x63 <= lc <= 0x67 and lc1 == lc - 1 and lc2 == lc - 2:
+            seq_alpha = True
+
+        prev2 = prev
+        prev = c
+        lc2 = lc1
+        lc1 = lc
+
+    return (mask, repeat, seq_num, seq_alpha)
@@ -10,11 +10,17 @@ CEH Student | Aspiring Cybersecurity Professional
 https://github.com/ROHITHD300900
 """
 
+import asyncio
 import socket
+import sys
 import argparse
 import json
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Terminal colors for output
 class Colors:
@@ -56,72 +62,85 @@ def banner():
 ╚═══════════════════════════════════════════════════════════════╝{Colors.END}
     """)
 
-def scan_port(host: str, port: int, timeout: float = 1.0) -> dict:
+# Open-port line template, built once instead of per result
+_OPEN_FMT = f"{Colors.GREEN}[+] Port %d/tcp OPEN - %s{Colors.END}"
+
+async def scan_port(host: str, port: int, sem: asyncio.Semaphore,
+                    timeout: float = 1.0) -> dict:
     """
     Scan a single port on the target host.
-    
+
     Args:
         host: Target IP address or hostname
         port: Port number to scan
+        sem: Semaphore bounding in-flight connections
         timeout: Connection timeout in seconds
-    
+
     Returns:
         Dictionary with port status and service info
     """
-    try:
+    async with sem:
+        loop = asyncio.get_running_loop()
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((host, port))
-        sock.close()
-        
-        if result == 0:
-            service = COMMON_PORTS.get(port, 'Unknown')
-            return {
-                'port': port,
-                'status': 'open',
-                'service': service
-            }
-    except socket.error:
-        pass
-    
-    return {'port': port, 'status': 'closed', 'service': None}
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            # Linux-only: avoid delayed-ACK stalls on the probe reply path
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except (AttributeError, OSError):
+            pass
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (host, port)), timeout)
+        except (OSError, asyncio.TimeoutError):
+            return {'port': port, 'status': 'closed', 'service': None}
+        finally:
+            sock.close()
+
+        return {
+            'port': port,
+            'status': 'open',
+            'service': COMMON_PORTS.get(port, 'Unknown')
+        }
 
-def scan_host(host: str, ports: list = None, threads: int = 50) -> dict:
+async def scan_host(host: str, ports=None, threads: int = 50) -> dict:
     """
-    Scan multiple ports on a host using threading.
-    
+    Scan multiple ports on a host using asyncio.
+
     Args:
         host: Target IP or hostname
-        ports: List of ports to scan (default: common ports)
-        threads: Number of concurrent threads
-    
+        ports: Iterable of ports to scan (default: common ports)
+        threads: Maximum number of in-flight connections
+
     Returns:
         Dictionary with scan results
     """
     if ports is None:
-        ports = list(COMMON_PORTS.keys())
-    
+        ports = COMMON_PORTS.keys()
+
     results = {
         'host': host,
         'scan_time': datetime.now().isoformat(),
         'open_ports': [],
         'closed_ports': 0
     }
-    
+
     print(f"\n{Colors.YELLOW}[*] Scanning {host}...{Colors.END}")
     print(f"{Colors.YELLOW}[*] Ports to scan: {len(ports)}{Colors.END}\n")
-    
-    with ThreadPoolExecutor(max_workers=threads) as executor:
-        futures = {executor.submit(scan_port, host, port): port for port in ports}
-        
-        for future in as_completed(futures):
-            result = future.result()
-            if result['status'] == 'open':
-                results['open_ports'].append(result)
-                print(f"{Colors.GREEN}[+] Port {result['port']}/tcp OPEN - {result['service']}{Colors.END}")
-            else:
-                results['closed_ports'] += 1
-    
+
+    sem = asyncio.Semaphore(threads)
+    tasks = [scan_port(host, port, sem) for port in ports]
+
+    lines = []
+    for result in await asyncio.gather(*tasks):
+        if result['status'] == 'open':
+            results['open_ports'].append(result)
+            lines.append(_OPEN_FMT % (result['port'], result['service']))
+        else:
+            results['closed_ports'] += 1
+
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
     return results
 
 def print_summary(results: dict):
@@ -176,20 +195,24 @@ def main():
     if args.ports:
         if '-' in args.ports:
             start, end = map(int, args.ports.split('-'))
-            ports = list(range(start, end + 1))
+            ports = range(start, end + 1)
         else:
             ports = [int(p) for p in args.ports.split(',')]
     
     # Run the scan
-    results = scan_host(args.target, ports, args.threads)
+    results = asyncio.run(scan_host(args.target, ports, args.threads))
     
     # Print summary
     print_summary(results)
     
     # Save to file if specified
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson is not None:
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
         print(f"{Colors.GREEN}[+] Results saved to {args.output}{Colors.END}")
 
 if __name__ == '__main__':
@@ -11,10 +11,20 @@ https://github.com/ROHITHD300900
 """
 
 import re
+import os
+import sys
+import mmap
 import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple
 
+try:
+    # Compiled single-pass scanner (see _analyzer.pyx); optional
+    from _analyzer import scan_bytes as _scan_bytes_fast
+except ImportError:
+    _scan_bytes_fast = None
+
 # Terminal colors
 class Colors:
     GREEN = '\033[92m'
@@ -24,13 +34,35 @@ class Colors:
     END = '\033[0m'
     BOLD = '\033[1m'
 
-# Common weak passwords list
-COMMON_PASSWORDS = [
+# Byte-class lookup table: maps each byte to a 4-bit mask
+# (1=uppercase, 2=lowercase, 4=digit, 8=special)
+_SPECIAL_CHARS = b'!@#$%^&*(),.?":{}|<>'
+
+def _class_bits(byte: int) -> int:
+    if 0x41 <= byte <= 0x5A:
+        return 1
+    if 0x61 <= byte <= 0x7A:
+        return 2
+    if 0x30 <= byte <= 0x39:
+        return 4
+    if byte in _SPECIAL_CHARS:
+        return 8
+    return 0
+
+_CLASS = bytes(_class_bits(b) for b in range(256))
+
+# Precompiled patterns - compiled once at import instead of per call
+_REPEAT = re.compile(r'(.)\1{2,}')
+_SEQ_NUM = re.compile(r'(?:012|123|234|345|456|567|678|789)')
+_SEQ_ALPHA = re.compile(r'(?:abc|bcd|cde|def|efg)')
+
+# Common weak passwords - frozenset for O(1) membership tests
+COMMON_PASSWORDS = frozenset({
     'password', '123456', '12345678', 'qwerty', 'abc123',
     'monkey', '1234567', 'letmein', 'trustno1', 'dragon',
     'baseball', 'iloveyou', 'master', 'sunshine', 'ashley',
     'football', 'shadow', 'passw0rd', 'admin', 'welcome'
-]
+})
 
 def banner():
     print(f"""
@@ -53,15 +85,24 @@ def check_length(password: str) -> Tuple[int, str]:
     else:
         return (0, f"{Colors.RED}Weak{Colors.END} - {length} characters")
 
-def check_complexity(password: str) -> Dict[str, bool]:
-    """Check password complexity"""
+def _complexity_from_bytes(data: bytes) -> Dict[str, bool]:
+    """Classify raw password bytes through the lookup table"""
+    mask = 0
+    for bits in data.translate(_CLASS):
+        mask |= bits
+        if mask == 0xF:
+            break
     return {
-        'uppercase': bool(re.search(r'[A-Z]', password)),
-        'lowercase': bool(re.search(r'[a-z]', password)),
-        'numbers': bool(re.search(r'\d', password)),
-        'special': bool(re.search(r'[!@#$%^&*(),.?":{}|<>]', password))
+        'uppercase': bool(mask & 1),
+        'lowercase': bool(mask & 2),
+        'numbers': bool(mask & 4),
+        'special': bool(mask & 8)
     }
 
+def check_complexity(password: str) -> Dict[str, bool]:
+    """Check password complexity"""
+    return _complexity_from_bytes(password.encode('utf-8', 'replace'))
+
 def check_common(password: str) -> bool:
     """Check if password is commonly used"""
     return password.lower() in COMMON_PASSWORDS
@@ -69,79 +110,145 @@ def check_common(password: str) -> bool:
 def check_patterns(password: str) -> List[str]:
     """Check for weak patterns"""
     warnings = []
-    
-    if re.search(r'(.)\1{2,}', password):
+
+    if _REPEAT.search(password):
         warnings.append("Contains repeated characters")
-    if re.search(r'(012|123|234|345|456|567|678|789)', password):
+    if _SEQ_NUM.search(password):
         warnings.append("Contains sequential numbers")
-    if re.search(r'(abc|bcd|cde|def|efg)', password.lower()):
+    if _SEQ_ALPHA.search(password.lower()):
         warnings.append("Contains sequential letters")
-    if re.search(r'^[a-zA-Z]+$', password):
+    if password.isalpha():
         warnings.append("Contains only letters")
-    if re.search(r'^\d+$', password):
+    if password.isdigit():
         warnings.append("Contains only numbers")
-    
+
     return warnings
 
-def calculate_score(password: str) -> int:
-    """Calculate overall password strength score (0-100)"""
+def _pattern_warnings(mask: int, repeat: bool, seq_num: bool,
+                      seq_alpha: bool) -> List[str]:
+    """Build the warning list from a compiled scan_bytes result"""
+    warnings = []
+
+    if repeat:
+        warnings.append("Contains repeated characters")
+    if seq_num:
+        warnings.append("Contains sequential numbers")
+    if seq_alpha:
+        warnings.append("Contains sequential letters")
+    if mask and not mask & ~3:
+        warnings.append("Contains only letters")
+    if mask == 4:
+        warnings.append("Contains only numbers")
+
+    return warnings
+
+def _scan(password: str) -> Tuple[Dict[str, bool], List[str]]:
+    """Run the complexity and pattern checks in one shot"""
+    return check_complexity(password), check_patterns(password)
+
+def _score(length: int, complexity: Dict[str, bool], warnings: List[str],
+           is_common: bool) -> int:
+    """Combine already-computed checks into a 0-100 score"""
     score = 0
-    
+
     # Length score (max 40)
-    score += min(len(password) * 3, 40)
-    
+    score += min(length * 3, 40)
+
     # Complexity score (max 40)
-    complexity = check_complexity(password)
     score += sum(10 for v in complexity.values() if v)
-    
+
     # Pattern penalties
-    warnings = check_patterns(password)
     score -= len(warnings) * 5
-    
+
     # Common password penalty
-    if check_common(password):
+    if is_common:
         score -= 30
-    
+
     return max(0, min(100, score))
 
+def calculate_score(password: str) -> int:
+    """Calculate overall password strength score (0-100)"""
+    if check_common(password):
+        return 0
+    complexity, warnings = _scan(password)
+    return _score(len(password), complexity, warnings, False)
+
 def get_hash(password: str) -> Dict[str, str]:
     """Generate common hashes of password"""
+    data = password.encode('utf-8')
     return {
-        'MD5': hashlib.md5(password.encode()).hexdigest(),
-        'SHA-256': hashlib.sha256(password.encode()).hexdigest()
+        'MD5': hashlib.md5(data, usedforsecurity=False).hexdigest(),
+        'SHA-256': hashlib.sha256(data, usedforsecurity=False).hexdigest()
     }
 
-def analyze_password(password: str) -> Dict:
-    """Perform complete password analysis"""
-    score = calculate_score(password)
-    
-    if score >= 80:
-        strength = f"{Colors.GREEN}STRONG{Colors.END}"
-    elif score >= 60:
-        strength = f"{Colors.GREEN}GOOD{Colors.END}"
-    elif score >= 40:
-        strength = f"{Colors.YELLOW}MODERATE{Colors.END}"
+# Strength label per 20-point score band, indexed by score // 20
+_STRENGTH = ('WEAK', 'WEAK', 'MODERATE', 'GOOD', 'STRONG', 'STRONG')
+
+def analyze_password_bytes(data: bytes) -> Dict:
+    """
+    Perform complete password analysis on a raw bytes password.
+
+    File mode feeds byte slices straight from the mapped wordlist; the
+    str form is only materialized for the checks that need it.
+    """
+    password = data.decode('utf-8', 'replace')
+    is_common = check_common(password)
+
+    if _scan_bytes_fast is not None:
+        mask, repeat, seq_num, seq_alpha = _scan_bytes_fast(data)
+        complexity = {
+            'uppercase': bool(mask & 1),
+            'lowercase': bool(mask & 2),
+            'numbers': bool(mask & 4),
+            'special': bool(mask & 8)
+        }
+        # Known-common passwords score 0 no matter what, so skip the
+        # pattern checks entirely
+        warnings = [] if is_common else _pattern_warnings(mask, repeat,
+                                                          seq_num, seq_alpha)
     else:
-        strength = f"{Colors.RED}WEAK{Colors.END}"
-    
+        complexity = _complexity_from_bytes(data)
+        warnings = [] if is_common else check_patterns(password)
+
+    score = 0 if is_common else _score(len(password), complexity, warnings, False)
+    strength = _STRENGTH[score // 20]
+
     return {
         'password_length': len(password),
         'score': score,
         'strength': strength,
-        'complexity': check_complexity(password),
-        'is_common': check_common(password),
-        'warnings': check_patterns(password),
-        'hashes': get_hash(password)
+        'complexity': complexity,
+        'is_common': is_common,
+        'warnings': warnings,
+        'hashes': {
+            'MD5': hashlib.md5(data, usedforsecurity=False).hexdigest(),
+            'SHA-256': hashlib.sha256(data, usedforsecurity=False).hexdigest()
+        }
     }
 
+def analyze_password(password: str) -> Dict:
+    """Perform complete password analysis"""
+    return analyze_password_bytes(password.encode('utf-8', 'replace'))
+
+# Strength labels are colored at print time so worker results stay
+# plain (picklable, ANSI-free) in process-pool mode
+_STRENGTH_COLORS = {
+    'STRONG': 'GREEN',
+    'GOOD': 'GREEN',
+    'MODERATE': 'YELLOW',
+    'WEAK': 'RED'
+}
+
 def print_analysis(results: Dict):
     """Print analysis results"""
+    color_name = _STRENGTH_COLORS.get(results['strength'])
+    color = getattr(Colors, color_name) if color_name else ''
     print(f"\n{'='*60}")
     print(f"  PASSWORD ANALYSIS RESULTS")
     print(f"{'='*60}")
     print(f"  Length: {results['password_length']} characters")
     print(f"  Score: {results['score']}/100")
-    print(f"  Strength: {results['strength']}")
+    print(f"  Strength: {color}{results['strength']}{Colors.END}")
     
     print(f"\n  Complexity Check:")
     comp = results['complexity']
@@ -164,29 +271,53 @@ def print_analysis(results: Dict):
     
     print(f"{'='*60}\n")
 
+def print_tsv(results: Dict):
+    """Print one compact tab-separated line per password"""
+    line = f"{results['password_length']}\t{results['score']}\t{results['strength']}\n"
+    sys.stdout.buffer.write(line.encode('ascii'))
+
 def main():
     parser = argparse.ArgumentParser(description='Password Security Analyzer')
     parser.add_argument('-c', '--check', help='Password to analyze')
     parser.add_argument('-f', '--file', help='File with passwords to analyze')
-    
+    parser.add_argument(
+        '--format',
+        choices=['pretty', 'tsv'],
+        default=None,
+        help='Output format (default: pretty on a terminal, tsv when piped)'
+    )
+
     args = parser.parse_args()
-    banner()
-    
+
+    tty = sys.stdout.isatty()
+    if not tty:
+        # Keep ANSI escapes out of pipes and files
+        for name in ('GREEN', 'YELLOW', 'RED', 'BLUE', 'END', 'BOLD'):
+            setattr(Colors, name, '')
+    fmt = args.format or ('pretty' if tty else 'tsv')
+    emit = print_analysis if fmt == 'pretty' else print_tsv
+
+    if fmt == 'pretty':
+        banner()
+
     if args.check:
-        results = analyze_password(args.check)
-        print_analysis(results)
+        emit(analyze_password(args.check))
     elif args.file:
-        with open(args.file, 'r') as f:
-            for line in f:
-                password = line.strip()
-                if password:
-                    print(f"\nAnalyzing: {'*' * len(password)}")
-                    results = analyze_password(password)
-                    print_analysis(results)
+        with open(args.file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                passwords = [p for p in (line.strip() for line in mm[:].splitlines()) if p]
+            finally:
+                mm.close()
+        with ProcessPoolExecutor() as executor:
+            for results in executor.map(analyze_password_bytes, passwords, chunksize=1024):
+                if fmt == 'pretty':
+                    print(f"\nAnalyzing: {'*' * results['password_length']}")
+                emit(results)
     else:
-        password = input("Enter password to analyze: ")
-        results = analyze_password(password)
-        print_analysis(results)
+        emit(analyze_password(input("Enter password to analyze: ")))
 
 if __name__ == '__main__':
     main()